@@ -3,10 +3,130 @@
 Clang Static Analyzer wrapper for detecting memory safety issues.
 """
 
+import asyncio
 import subprocess
 import os
+import hashlib
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
 from typing import List, Dict, Optional
 
+# Diagnostic header line: "file.c:123:45: warning: message"
+_WARN_RE = re.compile(r"^(.+?):(\d+):(\d+):\s+(warning|error):\s+(.*)$")
+
+
+@dataclass(slots=True)
+class AnalyzerWarning:
+    """A single diagnostic reported by the analyzer."""
+
+    file: str
+    line: str
+    column: str
+    severity: str
+    message: str
+    context: List[str] = field(default_factory=list)
+
+
+def json_default(obj):
+    """json.dump default= hook that serializes AnalyzerWarning as a dict."""
+    if isinstance(obj, AnalyzerWarning):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _run_sync(coro):
+    """Run a coroutine to completion from synchronous code.
+
+    asyncio.run refuses to start inside a running event loop, so in that
+    case the coroutine gets its own loop on a helper thread. The caller
+    blocks until it finishes either way.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        return ex.submit(asyncio.run, coro).result()
+
+
+def _file_size(path: str) -> int:
+    """Size of a file in bytes, or 0 if it can't be stat'ed."""
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def _file_digest(path: str) -> Optional[bytes]:
+    """SHA-256 of a file's contents, or None if it can't be read."""
+    h = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+    except OSError:
+        return None
+    return h.digest()
+
+
+def _retarget_result(result: Dict, source_file: str) -> Dict:
+    """Copy a per-file result for a duplicate living at source_file."""
+    original = result["file"]
+    copied = dict(result, file=source_file)
+    copied["warnings"] = [
+        replace(w, file=source_file) if w.file == original else w
+        for w in result["warnings"]
+    ]
+    return copied
+
+
+class _DiagnosticParser:
+    """Incremental parser for clang's text diagnostics, fed one line at a time."""
+
+    def __init__(self):
+        self.warnings: List[AnalyzerWarning] = []
+        # Non-empty lines that don't belong to any warning (e.g. driver errors)
+        self.unparsed: List[str] = []
+        self._current = None
+
+    def feed(self, line: str):
+        """Consume one line of output (without its trailing newline)."""
+        # Cheap substring test first; most lines are context, not headers
+        if ": warning:" not in line and ": error:" not in line:
+            if line.strip():
+                if self._current:
+                    # Additional context lines
+                    self._current.context.append(line)
+                else:
+                    self.unparsed.append(line)
+            return
+
+        if self._current:
+            self.warnings.append(self._current)
+
+        m = _WARN_RE.match(line)
+        if m:
+            self._current = AnalyzerWarning(
+                file=m.group(1).strip(),
+                line=m.group(2),
+                column=m.group(3),
+                severity=m.group(4),
+                message=m.group(5).strip()
+            )
+        else:
+            # e.g. "clang: error: ..." with no source location
+            self._current = None
+            self.unparsed.append(line)
+
+    def close(self) -> List[AnalyzerWarning]:
+        """Flush the pending warning and return all parsed warnings."""
+        if self._current:
+            self.warnings.append(self._current)
+            self._current = None
+        return self.warnings
+
 
 class CSAWrapper:
     """Wrapper for running Clang Static Analyzer on C/C++ source code."""
@@ -31,17 +151,68 @@ class CSAWrapper:
         "alpha.unix.cstring.OutOfBounds",
     ]
 
-    def __init__(self, clang_path: str = "clang"):
+    SOURCE_EXTENSIONS = (".c", ".cpp", ".cc", ".cxx", ".c++")
+
+    # Directory/file name substrings skipped by find_source_files
+    DEFAULT_EXCLUDE_PATTERNS = [
+        "fuzz", "afl", "honggfuzz", "libfuzzer",
+        "test", "tests", "example", "examples"
+    ]
+
+    # clang_path -> first line of `clang --version`, shared by all instances
+    _VERIFIED: Dict[str, str] = {}
+
+    def __init__(
+        self,
+        clang_path: str = "clang",
+        cache_dir: str = os.path.join("data", "cache", "csa"),
+        use_cache: bool = True
+    ):
         """Initialize CSA wrapper.
 
         Args:
             clang_path: Path to clang executable
+            cache_dir: Directory for cached per-file results
+            use_cache: Reuse results for unchanged files (disabled when the
+                CSA_NO_CACHE environment variable is set)
         """
         self.clang_path = clang_path
+        self.cache_dir = cache_dir
+        self.manifest_path = os.path.join(
+            os.path.dirname(cache_dir), "csa_manifest.json"
+        )
+        self.use_cache = use_cache and not os.environ.get("CSA_NO_CACHE")
+        self._clang_version = ""
         self._verify_clang()
 
+        # clang accepts a comma-separated checker list in a single flag
+        self._checker_args = [
+            "-Xclang", "-analyzer-checker=" + ",".join(self.MEMORY_CHECKERS)
+        ]
+
+        # Command prefix shared by every analyze_file call
+        self._cmd_prefix = (
+            self.clang_path,
+            "--analyze",
+            "-Xclang", "-analyzer-output=text",
+            *self._checker_args,
+        )
+
+        self._exclude_re = self._compile_patterns(self.DEFAULT_EXCLUDE_PATTERNS)
+
+    @staticmethod
+    def _compile_patterns(patterns: List[str]) -> "re.Pattern":
+        """Compile substring patterns into one case-insensitive regex."""
+        if not patterns:
+            return re.compile(r"(?!)")  # never matches
+        return re.compile("|".join(map(re.escape, patterns)), re.IGNORECASE)
+
     def _verify_clang(self):
         """Verify clang is available and supports static analysis."""
+        if self.clang_path in CSAWrapper._VERIFIED:
+            self._clang_version = CSAWrapper._VERIFIED[self.clang_path]
+            return
+
         try:
             result = subprocess.run(
                 [self.clang_path, "--version"],
@@ -49,7 +220,9 @@ class CSAWrapper:
                 text=True,
                 check=True
             )
-            print(f"Using: {result.stdout.splitlines()[0]}")
+            self._clang_version = result.stdout.splitlines()[0]
+            CSAWrapper._VERIFIED[self.clang_path] = self._clang_version
+            print(f"Using: {self._clang_version}")
         except (subprocess.CalledProcessError, FileNotFoundError) as e:
             raise RuntimeError(f"Clang not found or not working: {e}")
 
@@ -68,29 +241,157 @@ class CSAWrapper:
             List of absolute paths to source files
         """
         if exclude_patterns is None:
-            exclude_patterns = [
-                "fuzz", "afl", "honggfuzz", "libfuzzer",
-                "test", "tests", "example", "examples"
-            ]
+            exclude_re = self._exclude_re
+        else:
+            exclude_re = self._compile_patterns(exclude_patterns)
 
         source_files = []
-        extensions = {".c", ".cpp", ".cc", ".cxx", ".c++"}
+        pending = [os.path.abspath(root_dir)]
+
+        # os.scandir exposes the entry type from the directory listing, so
+        # this avoids the extra stat() per entry that os.walk performs.
+        while pending:
+            try:
+                it = os.scandir(pending.pop())
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Prune excluded directories before descending
+                        if not exclude_re.search(entry.name):
+                            pending.append(entry.path)
+                    elif (entry.name.endswith(self.SOURCE_EXTENSIONS)
+                          and not exclude_re.search(entry.name)):
+                        source_files.append(entry.path)
+
+        return sorted(source_files)
+
+    async def _run(self, cmd: List[str], timeout: int = 60):
+        """Run a command without blocking the event loop.
+
+        Returns:
+            Tuple of (returncode, stdout bytes, stderr bytes)
+
+        Raises:
+            asyncio.TimeoutError: if the command outlives timeout seconds
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
+        return proc.returncode, stdout, stderr
 
-        for root, dirs, files in os.walk(root_dir):
-            # Skip directories matching exclude patterns
-            dirs[:] = [
-                d for d in dirs
-                if not any(pattern in d.lower() for pattern in exclude_patterns)
+    async def _stream_stderr(self, cmd: List[str], on_line, timeout: int = 60):
+        """Run a command, passing each stderr line to on_line as it arrives.
+
+        stdout is discarded. Returns the exit code.
+
+        Raises:
+            asyncio.TimeoutError: if the command outlives timeout seconds
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+            limit=1 << 20  # tolerate very long diagnostic lines
+        )
+
+        async def _consume():
+            async for raw in proc.stderr:
+                on_line(raw.decode(errors="replace").rstrip("\r\n"))
+            return await proc.wait()
+
+        try:
+            return await asyncio.wait_for(_consume(), timeout)
+        finally:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+
+    async def _cache_key(
+        self,
+        source_file: str,
+        extra_args: List[str]
+    ) -> Optional[str]:
+        """Compute the cache key for a file, or None if it can't be preprocessed.
+
+        The key covers the preprocessed source (so header changes are picked
+        up), the checker set, the clang version and the extra arguments.
+        """
+        try:
+            returncode, preprocessed, _ = await self._run(
+                [self.clang_path, "-E", *extra_args, source_file]
+            )
+        except (asyncio.TimeoutError, OSError):
+            return None
+        if returncode != 0:
+            return None
+
+        h = hashlib.sha256()
+        for part in (
+            os.path.abspath(source_file).encode(),
+            preprocessed,
+            "\0".join(sorted(self.MEMORY_CHECKERS)).encode(),
+            self._clang_version.encode(),
+            "\0".join(extra_args).encode(),
+        ):
+            h.update(part)
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def _load_cached(self, key: str) -> Optional[Dict]:
+        """Load a cached result, ignoring missing or corrupt entries."""
+        try:
+            with open(os.path.join(self.cache_dir, f"{key}.json")) as f:
+                result = json.load(f)
+            result["warnings"] = [
+                AnalyzerWarning(**w) for w in result["warnings"]
             ]
+            return result
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
 
-            for file in files:
-                if any(file.endswith(ext) for ext in extensions):
-                    # Additional check: skip if path contains exclude patterns
-                    full_path = os.path.join(root, file)
-                    if not any(pattern in full_path.lower() for pattern in exclude_patterns):
-                        source_files.append(os.path.abspath(full_path))
+    def _store_cached(self, key: str, result: Dict):
+        """Write a result to the cache."""
+        self._write_json(os.path.join(self.cache_dir, f"{key}.json"), result)
 
-        return sorted(source_files)
+    @staticmethod
+    def _write_json(path: str, data) -> bool:
+        """Write JSON atomically, returning False if the write failed."""
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(data, f, default=json_default)
+            os.replace(tmp_path, path)
+            return True
+        except OSError:
+            return False
+
+    def _config_digest(self, extra_args: List[str]) -> str:
+        """Fingerprint of everything besides the source that affects results."""
+        return hashlib.sha256("\0".join([
+            self._clang_version,
+            ",".join(sorted(self.MEMORY_CHECKERS)),
+            *extra_args,
+        ]).encode()).hexdigest()
+
+    def _load_manifest(self) -> Dict:
+        """Load the incremental-analysis manifest (abs path -> entry)."""
+        try:
+            with open(self.manifest_path) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
 
     def analyze_file(
         self,
@@ -104,100 +405,163 @@ class CSAWrapper:
             extra_args: Additional compiler arguments (e.g., include paths)
 
         Returns:
-            Dictionary with analysis results
+            Dictionary with analysis results; "warnings" is a list of
+            AnalyzerWarning (serialize with json_default)
+        """
+        return _run_sync(self._analyze_file_async(source_file, extra_args))
+
+    def analyze_files_batch(
+        self,
+        source_files: List[str],
+        extra_args: Optional[List[str]] = None
+    ) -> List[Dict]:
+        """Run CSA on several files sharing one clang invocation.
+
+        This saves the clang driver start-up cost per file. Warnings are
+        assigned to files by their location. A warning in a header goes to
+        the most recent batch file that had a warning of its own, so keep
+        batches small if header warnings matter. "success" and "stderr"
+        come from the shared clang run and are the same for every file.
+        Results of a shared run are never cached, since they depend on the
+        other files in the batch.
+
+        Args:
+            source_files: Paths to source files, all compiled with extra_args
+            extra_args: Additional compiler arguments (e.g., include paths)
+
+        Returns:
+            List of per-file result dictionaries, in source_files order
+        """
+        results, _ = _run_sync(
+            self._analyze_batch_async(source_files, extra_args)
+        )
+        return results
+
+    async def _analyze_file_async(
+        self,
+        source_file: str,
+        extra_args: Optional[List[str]] = None
+    ) -> Dict:
+        """Coroutine behind analyze_file; see there for arguments."""
+        results, _ = await self._analyze_batch_async([source_file], extra_args)
+        return results[0]
+
+    async def _analyze_batch_async(
+        self,
+        source_files: List[str],
+        extra_args: Optional[List[str]] = None
+    ):
+        """Coroutine behind analyze_files_batch; see there for arguments.
+
+        Returns:
+            Tuple of (per-file results, per-file flags telling whether each
+            result is attributed with certainty and may be persisted)
         """
         if extra_args is None:
             extra_args = []
 
-        # Build checker arguments
-        checker_args = []
-        for checker in self.MEMORY_CHECKERS:
-            checker_args.extend(["-Xclang", f"-analyzer-checker={checker}"])
-
-        # Base command
-        cmd = [
-            self.clang_path,
-            "--analyze",
-            "-Xclang", "-analyzer-output=text",
+        results = [None] * len(source_files)
+        cache_keys = [None] * len(source_files)
+        if self.use_cache:
+            for i, source_file in enumerate(source_files):
+                cache_keys[i] = await self._cache_key(source_file, extra_args)
+                if cache_keys[i]:
+                    results[i] = self._load_cached(cache_keys[i])
+
+        misses = [i for i, result in enumerate(results) if result is None]
+        cacheable = [True] * len(source_files)
+        if not misses:
+            return results, cacheable
+
+        fresh = await self._run_analyzer(
+            [source_files[i] for i in misses], extra_args
+        )
+        # With several files in one clang run, success/stderr are shared and
+        # header warnings may be misattributed, so keep them out of caches.
+        shared = len(misses) > 1
+        for i, result in zip(misses, fresh):
+            results[i] = result
+            cacheable[i] = not shared
+            # Only cache completed runs so timeouts get retried next time
+            if cache_keys[i] and not shared and not result["errors"]:
+                self._store_cached(cache_keys[i], result)
+
+        return results, cacheable
+
+    async def _run_analyzer(
+        self,
+        source_files: List[str],
+        extra_args: List[str]
+    ) -> List[Dict]:
+        """Invoke clang --analyze once on source_files and split the output."""
+        cmd = [*self._cmd_prefix, *extra_args, *source_files]
+        timeout = 60 * len(source_files)  # 1 minute timeout per file
+
+        results = [
+            {
+                "file": source_file,
+                "success": False,
+                "warnings": [],
+                "errors": [],
+                "stdout": "",
+                "stderr": ""
+            }
+            for source_file in source_files
         ]
-        cmd.extend(checker_args)
-        cmd.extend(extra_args)
-        cmd.append(source_file)
-
-        result = {
-            "file": source_file,
-            "success": False,
-            "warnings": [],
-            "errors": [],
-            "stdout": "",
-            "stderr": ""
-        }
 
         try:
-            proc = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60  # 1 minute timeout per file
-            )
-
-            result["stdout"] = proc.stdout
-            result["stderr"] = proc.stderr
-            result["success"] = proc.returncode == 0
-
             # Parse warnings from stderr (clang analyzer outputs to stderr)
-            if proc.stderr:
-                result["warnings"] = self._parse_text_output(proc.stderr)
-
-        except subprocess.TimeoutExpired:
-            result["errors"].append("Analysis timeout (60s)")
+            # as it is produced instead of buffering the whole output
+            parser = _DiagnosticParser()
+            returncode = await self._stream_stderr(cmd, parser.feed, timeout)
+
+            index = {}
+            for i, source_file in enumerate(source_files):
+                index[source_file] = i
+                index.setdefault(os.path.abspath(source_file), i)
+
+            current = 0
+            for warning in parser.close():
+                current = index.get(warning.file, current)
+                results[current]["warnings"].append(warning)
+
+            for result in results:
+                result["stderr"] = "\n".join(parser.unparsed)
+                result["success"] = returncode == 0
+
+        except asyncio.TimeoutError:
+            for result in results:
+                result["errors"].append(f"Analysis timeout ({timeout}s)")
         except Exception as e:
-            result["errors"].append(f"Analysis failed: {str(e)}")
+            for result in results:
+                result["errors"].append(f"Analysis failed: {str(e)}")
 
-        return result
+        return results
 
-    def _parse_text_output(self, output: str) -> List[Dict]:
+    def _parse_text_output(self, output: str) -> List[AnalyzerWarning]:
         """Parse text output from clang analyzer.
 
         Args:
             output: stderr output from clang
 
         Returns:
-            List of warning dictionaries
+            List of AnalyzerWarning objects
         """
-        warnings = []
-        current_warning = None
-
+        parser = _DiagnosticParser()
         for line in output.splitlines():
-            # Match warning/error lines: "file.c:123:45: warning: message"
-            if ": warning:" in line or ": error:" in line:
-                if current_warning:
-                    warnings.append(current_warning)
-
-                parts = line.split(":", 4)
-                if len(parts) >= 5:
-                    current_warning = {
-                        "file": parts[0].strip(),
-                        "line": parts[1].strip(),
-                        "column": parts[2].strip(),
-                        "severity": parts[3].strip(),
-                        "message": parts[4].strip(),
-                        "context": []
-                    }
-            elif current_warning and line.strip():
-                # Additional context lines
-                current_warning["context"].append(line)
-
-        if current_warning:
-            warnings.append(current_warning)
-
-        return warnings
+            parser.feed(line)
+        return parser.close()
 
     def analyze_directory(
         self,
         root_dir: str,
         max_files: Optional[int] = None,
-        extra_args: Optional[List[str]] = None
+        extra_args: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+        incremental: bool = True,
+        order: str = "size-desc",
+        dedupe: bool = True,
+        batch_size: int = 1
     ) -> Dict:
         """Run CSA on all source files in a directory.
 
@@ -205,6 +569,15 @@ class CSAWrapper:
             root_dir: Root directory containing source code
             max_files: Maximum number of files to analyze (for testing)
             extra_args: Additional compiler arguments
+            max_workers: Number of parallel clang processes (default: CPU count)
+            incremental: Skip files unchanged (by mtime and size) since the
+                last run and reuse their previous results
+            order: Dispatch order, "size-desc" (largest files first) or "lex"
+                (path order). Results are always returned in path order.
+            dedupe: Analyze byte-identical files only once. Copies whose
+                quoted includes resolve to different headers would be
+                missed; pass False for such trees.
+            batch_size: Files per clang invocation; see analyze_files_batch
 
         Returns:
             Dictionary with aggregated results
@@ -220,71 +593,207 @@ class CSAWrapper:
                 "results": []
             }
 
+        # Everything under root_dir that still exists, before any truncation
+        found_files = set(source_files)
+
         if max_files:
             source_files = source_files[:max_files]
 
         print(f"Found {len(source_files)} source files to analyze")
 
-        results = {
-            "files_analyzed": 0,
-            "files_with_warnings": 0,
-            "total_warnings": 0,
-            "results": []
-        }
-
-        for i, source_file in enumerate(source_files, 1):
-            print(f"[{i}/{len(source_files)}] Analyzing {os.path.basename(source_file)}...", end=" ")
+        # Files are analyzed in clang subprocesses (batch_size files each); a
+        # semaphore caps how many run at once while a single event loop
+        # collects results.
+        file_results = [None] * len(source_files)
+        # Indices whose results came from a shared multi-file clang run
+        uncacheable = set()
+        pending = list(range(len(source_files)))
+
+        # Incremental mode: reuse the last result for files whose mtime and
+        # size are unchanged. Unlike the content cache this does not notice
+        # edits to included headers, but it never spawns clang for them.
+        incremental = incremental and self.use_cache
+        if incremental:
+            manifest = self._load_manifest()
+            config = self._config_digest(extra_args or [])
+            stats = {}
+            pending = []
+            for idx, source_file in enumerate(source_files):
+                try:
+                    st = os.stat(source_file)
+                except OSError:
+                    pending.append(idx)
+                    continue
+                stats[idx] = (st.st_mtime_ns, st.st_size)
+                entry = manifest.get(source_file)
+                if (isinstance(entry, dict) and entry.get("result")
+                        and entry.get("config") == config
+                        and (entry.get("mtime"), entry.get("size")) == stats[idx]):
+                    file_results[idx] = self._load_cached(entry["result"])
+                if file_results[idx] is None:
+                    pending.append(idx)
+
+            reused = len(source_files) - len(pending)
+            if reused:
+                print(f"Reusing results for {reused} unchanged files")
+
+        async def _analyze(batch: List[int], sem: asyncio.Semaphore):
+            async with sem:
+                batch_results, cacheable = await self._analyze_batch_async(
+                    [source_files[idx] for idx in batch], extra_args
+                )
+                return batch, batch_results, cacheable
+
+        if order == "size-desc":
+            # Largest translation units first: they are the likeliest roots
+            # and the longest jobs, so starting them early shortens the tail.
+            pending.sort(key=lambda idx: _file_size(source_files[idx]),
+                         reverse=True)
+        elif order != "lex":
+            raise ValueError(f"Unknown order: {order!r}")
+
+        # Vendored copies of the same file are analyzed once; every other
+        # path in the bucket gets a copy of the result.
+        duplicates = {idx: [] for idx in pending}
+        if dedupe:
+            first_by_digest = {}
+            jobs = []
+            for idx in pending:
+                digest = _file_digest(source_files[idx])
+                # The extension picks C vs C++ mode, so it is part of the key
+                ext = os.path.splitext(source_files[idx])[1]
+                first = (first_by_digest.setdefault((digest, ext), idx)
+                         if digest else idx)
+                if first == idx:
+                    jobs.append(idx)
+                else:
+                    duplicates[first].append(idx)
+            if len(jobs) < len(pending):
+                print(f"Skipping {len(pending) - len(jobs)} duplicate files")
+        else:
+            jobs = list(pending)
+
+        # All files share extra_args here, so any of them can be batched
+        # together; batch_size=1 keeps one clang process per file.
+        batches = [
+            jobs[i:i + batch_size] for i in range(0, len(jobs), batch_size)
+        ]
 
-            file_result = self.analyze_file(source_file, extra_args=extra_args)
-            results["results"].append(file_result)
-            results["files_analyzed"] += 1
+        async def _gather():
+            sem = asyncio.Semaphore(max_workers or os.cpu_count() or 1)
+            # Create tasks up front so they queue on the semaphore in order
+            tasks = [
+                asyncio.ensure_future(_analyze(batch, sem)) for batch in batches
+            ]
 
-            if file_result["warnings"]:
-                results["files_with_warnings"] += 1
-                results["total_warnings"] += len(file_result["warnings"])
-                print(f"WARNING: {len(file_result['warnings'])} warnings")
-            else:
-                print("OK")
+            done = 0
+            for task in asyncio.as_completed(tasks):
+                batch, batch_results, cacheable = await task
+                for idx, file_result, ok in zip(batch, batch_results, cacheable):
+                    done += 1
+                    file_results[idx] = file_result
+                    for dup_idx in duplicates[idx]:
+                        file_results[dup_idx] = _retarget_result(
+                            file_result, source_files[dup_idx]
+                        )
+                    if not ok:
+                        uncacheable.add(idx)
+                        uncacheable.update(duplicates[idx])
+
+                    if file_result["warnings"]:
+                        status = (f"WARNING: {len(file_result['warnings'])} "
+                                  "warnings")
+                    else:
+                        status = "OK"
+                    if duplicates[idx]:
+                        status += f" (+{len(duplicates[idx])} duplicates)"
+
+                    print(f"[{done}/{len(jobs)}] Analyzed "
+                          f"{os.path.basename(source_files[idx])}... {status}")
+
+        if jobs:
+            _run_sync(_gather())
+
+        if incremental:
+            for idx in pending:
+                file_result = file_results[idx]
+                if (file_result["errors"] or idx not in stats
+                        or idx in uncacheable):
+                    manifest.pop(source_files[idx], None)
+                    continue
+                key = "file-" + hashlib.sha256(
+                    source_files[idx].encode()
+                ).hexdigest()
+                self._store_cached(key, file_result)
+                mtime, size = stats[idx]
+                manifest[source_files[idx]] = {
+                    "mtime": mtime,
+                    "size": size,
+                    "config": config,
+                    "result": key,
+                }
+
+            # Forget files under root_dir that were deleted or are now excluded
+            root_prefix = os.path.join(os.path.abspath(root_dir), "")
+            for path in list(manifest):
+                if path.startswith(root_prefix) and path not in found_files:
+                    del manifest[path]
+
+            self._write_json(self.manifest_path, manifest)
+
+        # Results stay in source order regardless of completion order
+        results = {
+            "files_analyzed": len(file_results),
+            "files_with_warnings": sum(1 for r in file_results if r["warnings"]),
+            "total_warnings": sum(len(r["warnings"]) for r in file_results),
+            "results": file_results
+        }
 
         return results
 
-    def summarize_results(self, results: Dict) -> str:
-        """Create a human-readable summary of analysis results.
+    def iter_summary(self, results: Dict):
+        """Yield a human-readable summary of analysis results line by line.
 
         Args:
             results: Results from analyze_directory
 
-        Returns:
-            Formatted summary string
+        Yields:
+            Summary lines, without trailing newlines
         """
         if "error" in results:
-            return f"Error: {results['error']}"
-
-        summary = [
-            f"\n{'='*60}",
-            "CSA Analysis Summary",
-            f"{'='*60}",
-            f"Files analyzed: {results['files_analyzed']}",
-            f"Files with warnings: {results['files_with_warnings']}",
-            f"Total warnings: {results['total_warnings']}",
-            f"{'='*60}\n"
-        ]
+            yield f"Error: {results['error']}"
+            return
+
+        yield f"\n{'='*60}"
+        yield "CSA Analysis Summary"
+        yield f"{'='*60}"
+        yield f"Files analyzed: {results['files_analyzed']}"
+        yield f"Files with warnings: {results['files_with_warnings']}"
+        yield f"Total warnings: {results['total_warnings']}"
+        yield f"{'='*60}\n"
 
         if results['total_warnings'] > 0:
-            summary.append("\nWarnings by file:")
-            summary.append("-" * 60)
+            yield "\nWarnings by file:"
+            yield "-" * 60
 
             for file_result in results['results']:
                 if file_result['warnings']:
                     rel_path = os.path.basename(file_result['file'])
-                    summary.append(f"\n{rel_path}: {len(file_result['warnings'])} warnings")
+                    yield f"\n{rel_path}: {len(file_result['warnings'])} warnings"
 
                     for warning in file_result['warnings']:
-                        summary.append(
-                            f"  Line {warning['line']}: {warning['message']}"
-                        )
+                        yield f"  Line {warning.line}: {warning.message}"
+
+    def summarize_results(self, results: Dict) -> str:
+        """Create a human-readable summary of analysis results.
 
-        return "\n".join(summary)
+        Args:
+            results: Results from analyze_directory
+
+        Returns:
+            Formatted summary string
+        """
+        return "\n".join(self.iter_summary(results))
 
 
 if __name__ == "__main__":
@@ -297,4 +806,5 @@ if __name__ == "__main__":
 
     wrapper = CSAWrapper()
     results = wrapper.analyze_directory(sys.argv[1], max_files=10)
-    print(wrapper.summarize_results(results))
+    for line in wrapper.iter_summary(results):
+        print(line)
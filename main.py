@@ -6,12 +6,22 @@ Main entry point for LLM-integrated static analysis.
 import os
 import sys
 import json
+import re
 from pathlib import Path
 
+# orjson is optional but serializes large results much faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from analyzers.csa_wrapper import CSAWrapper
+from analyzers.csa_wrapper import CSAWrapper, json_default
+
+# Directory names that hold fuzzing harnesses rather than project code
+FUZZER_DIR_RE = re.compile(r"fuzz|afl|honggfuzz|libfuzzer", re.IGNORECASE)
 
 
 def analyze_case(case_id: int, max_files: int = None):
@@ -30,20 +40,15 @@ def analyze_case(case_id: int, max_files: int = None):
         print(f"Run: bash scripts/extract_case.sh {case_id}")
         return None
 
-    # Find the actual project directory (not fuzzers)
-    project_dirs = []
+    # Use the first non-fuzzer directory as the project directory
     for item in buggy_src.iterdir():
-        if item.is_dir():
-            # Skip fuzzer directories
-            if not any(fuzz in item.name.lower() for fuzz in ["fuzz", "afl", "honggfuzz", "libfuzzer"]):
-                project_dirs.append(item)
-
-    if not project_dirs:
+        if item.is_dir() and not FUZZER_DIR_RE.search(item.name):
+            target_dir = item
+            break
+    else:
         print(f"Error: No project directories found in {buggy_src}")
         return None
 
-    # Use the first non-fuzzer directory
-    target_dir = project_dirs[0]
     print(f"Analyzing case {case_id}: {target_dir.name}")
 
     # Run CSA analysis
@@ -51,15 +56,22 @@ def analyze_case(case_id: int, max_files: int = None):
     results = wrapper.analyze_directory(str(target_dir), max_files=max_files)
 
     # Print summary
-    print(wrapper.summarize_results(results))
+    for line in wrapper.iter_summary(results):
+        print(line)
 
     # Save results
     output_dir = Path("data") / "results"
     output_dir.mkdir(exist_ok=True)
     output_file = output_dir / f"case_{case_id}_csa.json"
 
-    with open(output_file, "w") as f:
-        json.dump(results, f, indent=2)
+    if orjson is not None:
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(
+                results, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+            ))
+    else:
+        with open(output_file, "w") as f:
+            json.dump(results, f, indent=2, default=json_default)
 
     print(f"\nResults saved to: {output_file}")
 
@@ -3,6 +3,20 @@ import sqlite3, json, os, sys
 
 DB = os.path.join("data", "arvo", "arvo.db")
 
+def qi(name):
+    """Quote an SQL identifier (table/column names can't be bound as parameters)."""
+    return '"' + name.replace('"', '""') + '"'
+
+def connect_ro(path):
+    """Open the DB read-only, tuned for a read-only workload."""
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    conn.executescript(
+        "PRAGMA mmap_size=1073741824;"
+        "PRAGMA cache_size=-262144;"
+        "PRAGMA temp_store=MEMORY;"
+    )
+    return conn
+
 def find_table_with_id(conn):
     cur = conn.cursor()
     tables = [r[0] for r in cur.execute("SELECT name FROM sqlite_master WHERE type='table'")]
@@ -18,16 +32,19 @@ def find_table_with_id(conn):
 def pick_one_c_cpp_row(conn, table):
     cur = conn.cursor()
     # Try a few likely column names for filtering/IDs
-    cols = [c[1] for c in cur.execute(f"PRAGMA table_info({table})")]
+    cols = [c[1] for c in cur.execute(f"PRAGMA table_info({qi(table)})")]
     id_col = "id" if "id" in cols else (cols[0] if cols else "id")
     lang_cols = [c for c in cols if c.lower() in ("lang","language","project_lang","proj_lang")]
     # Build a simple SELECT
     if lang_cols:
         lang_col = lang_cols[0]
-        q = f"SELECT * FROM {table} WHERE {lang_col} LIKE '%C%+' OR {lang_col} LIKE '%C++%' LIMIT 1"
+        q = (f"SELECT * FROM {qi(table)} WHERE {qi(lang_col)} LIKE ? "
+             f"OR {qi(lang_col)} LIKE ? LIMIT 1")
+        params = ("%C%+", "%C++%")
     else:
-        q = f"SELECT * FROM {table} LIMIT 1"
-    row = cur.execute(q).fetchone()
+        q = f"SELECT * FROM {qi(table)} LIMIT 1"
+        params = ()
+    row = cur.execute(q, params).fetchone()
     if not row:
         raise RuntimeError("No rows found (try removing the language filter).")
     return cols, row
@@ -36,7 +53,7 @@ def main():
     if not os.path.exists(DB):
         print("Missing data/arvo/arvo.db – download from ARVO-Meta Releases first.", file=sys.stderr)
         sys.exit(1)
-    conn = sqlite3.connect(DB)
+    conn = connect_ro(DB)
     table = find_table_with_id(conn)
     cols, row = pick_one_c_cpp_row(conn, table)
     data = dict(zip(cols, row))
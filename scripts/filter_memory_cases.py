@@ -3,6 +3,14 @@ import json
 import csv
 import os
 import re
+from multiprocessing import Pool
+
+# orjson is optional but parses much faster than the stdlib json module
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 META_DIR = "data/arvo/ARVO-Meta/meta"
 OUTPUT_CSV = "data/arvo/memory_cases_asan.csv"
@@ -26,17 +34,18 @@ MEMORY_PATTERNS = [
 ]
 MEMORY_REGEX = re.compile("|".join(MEMORY_PATTERNS), re.IGNORECASE)
 
-rows = []
-for fname in os.listdir(META_DIR):
-    if not fname.endswith(".json"):
-        continue
-    path = os.path.join(META_DIR, fname)
+
+def classify(path):
+    """Parse one ARVO-Meta file and return (row, error) for it.
+
+    row is None if the case is not an ASan memory bug; error is set when
+    the file is not valid JSON.
+    """
     try:
-        with open(path, "r") as f:
-            data = json.load(f)
-    except json.JSONDecodeError:
-        print(f"Skipping invalid JSON: {fname}")
-        continue
+        with open(path, "rb") as f:
+            data = _loads(f.read())
+    except ValueError:  # json.JSONDecodeError and orjson.JSONDecodeError
+        return None, f"Skipping invalid JSON: {os.path.basename(path)}"
 
     local_id = data.get("localId")
     crash_type = data.get("crash_type") or ""
@@ -44,21 +53,40 @@ for fname in os.listdir(META_DIR):
 
     # Filter: sanitizer must be ASan, and crash_type must look like a memory bug
     if sanitizer == "asan" and MEMORY_REGEX.search(crash_type):
-        rows.append({
+        return {
             "localId": local_id,
             "crash_type": crash_type,
             "sanitizer": sanitizer,
-        })
+        }, None
+    return None, None
+
+
+def main():
+    with os.scandir(META_DIR) as it:
+        paths = [e.path for e in it if e.name.endswith(".json")]
+
+    # Parsing thousands of meta files is CPU-bound, so spread it over processes
+    rows = []
+    with Pool() as pool:
+        for row, error in pool.imap_unordered(classify, paths, chunksize=64):
+            if error:
+                print(error)
+            elif row:
+                rows.append(row)
+
+    # Sort results by ID (numerically)
+    rows.sort(key=lambda r: (r["localId"] is None, r["localId"]))
+
+    # Write CSV
+    os.makedirs(os.path.dirname(OUTPUT_CSV), exist_ok=True)
+    with open(OUTPUT_CSV, "w", newline="") as csvfile:
+        fieldnames = ["localId", "crash_type", "sanitizer"]
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
 
-# Sort results by ID (numerically)
-rows.sort(key=lambda r: (r["localId"] is None, r["localId"]))
+    print(f"✅ Wrote {len(rows)} ASan memory bugs to {OUTPUT_CSV}")
 
-# Write CSV
-os.makedirs(os.path.dirname(OUTPUT_CSV), exist_ok=True)
-with open(OUTPUT_CSV, "w", newline="") as csvfile:
-    fieldnames = ["localId", "crash_type", "sanitizer"]
-    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-    writer.writeheader()
-    writer.writerows(rows)
 
-print(f"✅ Wrote {len(rows)} ASan memory bugs to {OUTPUT_CSV}")
+if __name__ == "__main__":
+    main()